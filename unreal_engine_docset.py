@@ -10,6 +10,7 @@ docset from `Unreal Engine documentation <https://docs.unrealengine.com>`__:
 
 from __future__ import annotations
 
+import functools
 import html
 import logging
 import multiprocessing
@@ -20,18 +21,18 @@ import sqlite3
 import tempfile
 import time
 import xml.etree.ElementTree as Et
+from collections.abc import Generator
 from dataclasses import dataclass
 from itertools import chain
 from pathlib import Path
 from typing import Callable, TypedDict, cast
-from xml.dom import minidom
 
 import click
 import lxml.html
 import setuptools.archive_util
 from lxml import etree  # pyright: ignore
-from lxml.html import fromstring, tostring
-from tqdm.contrib.concurrent import process_map
+from lxml.html import tostring
+from tqdm import tqdm
 from typing_extensions import Unpack
 
 __author__ = "Thomas Mansencal"
@@ -44,10 +45,19 @@ __status__ = "Production"
 __all__ = [
     "Collector",
     "ApiInformation",
-    "Entry",
     "MAPPING_API_TYPE_TO_ENTRY_TYPE",
+    "REGEX_API_TYPE",
+    "XPATH_DASH_ANCHORS",
+    "XPATH_API_TITLE_AND_SYNTAX",
+    "XPATH_TEXT",
+    "HTML_PARSER",
+    "TRANSLATION_TABLE_SLASHES",
     "chdir",
     "join_path",
+    "iterate_html_files",
+    "list_index_directories",
+    "localise_link",
+    "append_css_overrides",
     "read_xml_file",
     "collector_cpp_default",
     "collector_cpp_nohref",
@@ -56,6 +66,7 @@ __all__ = [
     "COLLECTORS_BLUEPRINT",
     "collect_api_name_and_syntax",
     "collect_api_information",
+    "read_api_information",
     "process_cpp_html_file",
     "KwargsDocsetProcessor",
     "process_cpp_docset",
@@ -81,13 +92,13 @@ class Collector:
          Entry type corresponding to a supported *Dash*
         `entry type <https://kapeli.com/docsets#supportedentrytypes>`__.
     predicate
-        *XPath* expression predicate to collect the data.
+        Compiled *XPath* expression predicate to collect the data.
     processor
         Callable processing the collected data.
     """
 
     type: str  # noqa: A003
-    predicate: str
+    predicate: etree.XPath
     processor: Callable
 
 
@@ -112,26 +123,6 @@ class ApiInformation:
     dash_type: str | None
 
 
-@dataclass(frozen=True)
-class Entry:
-    """
-    Define a *Dash* documentation entry.
-
-    Parameters
-    ----------
-    name
-        Object name.
-    path
-        Object path in the documentation, typically a relative html path.
-    type
-        *Dash* entry type, e.g. ``Class``.
-    """
-
-    name: str
-    path: str
-    type: str  # noqa: A003
-
-
 MAPPING_API_TYPE_TO_ENTRY_TYPE: dict = {
     "class": "Class",
     "UCLASS": "Class",
@@ -141,6 +132,34 @@ MAPPING_API_TYPE_TO_ENTRY_TYPE: dict = {
 }
 """Mapping of *Unreal Engine* *API* type to *Dash* entry type."""
 
+REGEX_API_TYPE: re.Pattern = re.compile(
+    rf"(?P<type>{'|'.join(MAPPING_API_TYPE_TO_ENTRY_TYPE)}) (?P<name>\S+)"
+)
+"""
+Compiled regular expression matching an *Unreal Engine* *API* type followed by
+an object name in an *API* syntax.
+"""
+
+XPATH_DASH_ANCHORS: etree.XPath = etree.XPath('.//a[@class="dashAnchor"]')
+"""Compiled *XPath* expression selecting the *Dash* anchors."""
+
+XPATH_API_TITLE_AND_SYNTAX: etree.XPath = etree.XPath(
+    './/h1[@id="H1TitleId"] | .//div[@class="simplecode_api"]/p'
+)
+"""
+Compiled *XPath* expression selecting the *API* title and syntax paragraphs in
+a single traversal.
+"""
+
+XPATH_TEXT: etree.XPath = etree.XPath("text()")
+"""Compiled *XPath* expression selecting the direct text nodes of an element."""
+
+HTML_PARSER: lxml.html.HTMLParser = lxml.html.HTMLParser(encoding="utf-8")
+"""*HTML* parser used to read the *Unreal Engine* documentation files."""
+
+TRANSLATION_TABLE_SLASHES: dict = str.maketrans("\\", "/")
+"""Translation table converting backslashes to forward slashes."""
+
 
 class chdir:
     """
@@ -183,11 +202,156 @@ def join_path(parent: Path | str, name: str) -> str:
         Joined path.
     """
 
-    parent = re.sub(r"\\?/?index.html$", "", str(parent))
+    parent = str(parent)
+
+    if parent.endswith(("/index.html", "\\index.html")):
+        parent = parent[:-11]
+    elif parent.endswith("index.html"):
+        parent = parent[:-10]
 
     return f"{parent}/{name}"
 
 
+def iterate_html_files(directory: Path | str) -> Generator[str, None, None]:
+    """
+    Iterate over the *HTML* files in given directory and its sub-directories.
+
+    The files are yielded while the directories are being scanned so that their
+    processing can start before the discovery is complete.
+
+    Parameters
+    ----------
+    directory
+        Directory to iterate over.
+
+    Yields
+    ------
+    :class:`str`
+        *HTML* file path.
+    """
+
+    directories = [str(directory)]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(".html"):
+                    yield entry.path
+
+
+@functools.cache
+def list_index_directories(directory: str) -> frozenset[str]:
+    """
+    List the names of the sub-directories of given directory containing an
+    ``index.html`` file.
+
+    The results are memoized so that the many links of the pages in a directory
+    can be resolved with a set lookup instead of a filesystem query each. The
+    cache is unbounded: each directory name is stored at most once, in the
+    listing of its parent, thus the cache cannot grow larger than the
+    directory tree while evicting the listing of a large directory would cause
+    a full rescan of it.
+
+    Parameters
+    ----------
+    directory
+        Directory to list the sub-directories of.
+
+    Returns
+    -------
+    :class:`frozenset`
+        Names of the sub-directories containing an ``index.html`` file.
+    """
+
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "index.html"))
+            )
+    except OSError:
+        return frozenset()
+
+
+def localise_link(directory: str, link: str) -> str:
+    """
+    Update given link to point to an actual *HTML* file.
+
+    Parameters
+    ----------
+    directory
+        Directory of the file containing the link.
+    link
+        Link to update.
+
+    Returns
+    -------
+    :class:`str`
+        Link pointing to the ``index.html`` file of the linked directory if it
+        exists, the given link otherwise.
+    """
+
+    target = os.path.normpath(os.path.join(directory, link))
+
+    if os.path.basename(target) in list_index_directories(os.path.dirname(target)):
+        return f"{link}/index.html"
+
+    # The listing is case-sensitive: the filesystem is queried on a miss so that
+    # links resolved by case-insensitive filesystems, e.g. on *macOS* and
+    # *Windows*, are still localised.
+    if os.path.exists(os.path.join(directory, link, "index.html")):
+        return f"{link}/index.html"
+
+    return link
+
+
+def append_css_overrides(css_path: Path | str) -> None:
+    """
+    Append the *CSS* overrides hiding the online navigation elements to given
+    *CSS* file.
+
+    The overrides are preceded by a sentinel comment so that they are only
+    appended once if the docset is processed again.
+
+    Parameters
+    ----------
+    css_path
+        Path of the *CSS* file, e.g. ``Include/CSS/udn_public.css``.
+    """
+
+    sentinel = "/* dash-overrides */"
+
+    css_path = Path(css_path)
+
+    if css_path.exists() and sentinel in css_path.read_text():
+        return
+
+    with open(css_path, "a") as css_file:
+        css_file.write(
+            f"""
+{sentinel}
+#maincol {{
+    height: unset !important;
+}}
+
+#page_head, #navWrapper, #splitter, #footer {{
+    display: none !important;
+}}
+
+#contentContainer {{
+    margin-left: 0 !important;
+}}
+
+.toc {{
+    display: none !important;
+}}
+"""
+        )
+
+
 def read_xml_file(xml_path: Path | str, attempts: int = 10) -> lxml.html.HtmlElement:
     """
     Attempt to read given *XML* file.
@@ -211,17 +375,19 @@ def read_xml_file(xml_path: Path | str, attempts: int = 10) -> lxml.html.HtmlEle
     i = 0
     while i < attempts:
         try:
-            with open(xml_path) as xml_file:
-                xml = xml_file.read()
+            xml = lxml.html.parse(str(xml_path), parser=HTML_PARSER).getroot()
 
-            return fromstring(xml.encode("utf-8"))
+            # An empty document does not raise but has no root element.
+            if xml is not None:
+                return xml
         except etree.ParserError:
-            logger.debug(
-                'Could not parse "%s" file on attempt %s, sleeping...', xml_path, i + 1
-            )
-            i += 1
-            time.sleep(0.1)
-            continue
+            pass
+
+        logger.debug(
+            'Could not parse "%s" file on attempt %s, sleeping...', xml_path, i + 1
+        )
+        i += 1
+        time.sleep(0.1)
 
     raise RuntimeError('Could not parse "%s" file!', xml_path)
 
@@ -229,8 +395,8 @@ def read_xml_file(xml_path: Path | str, attempts: int = 10) -> lxml.html.HtmlEle
 def collector_cpp_default(
     elements: list[lxml.html.HtmlElement],
     parent_api_information: ApiInformation,  # noqa: ARG001
-    html_path: Path,
-) -> list[tuple[str, str]]:
+    html_path: Path | str,
+) -> list[tuple[ApiInformation, str]]:
     """
     Collect the *C++* *API* data for given elements.
 
@@ -259,9 +425,9 @@ def collector_cpp_default(
         if not Path(collected_path).exists():
             continue
 
-        collected_name = collect_api_information(read_xml_file(collected_path)).name
+        collected_api_information = read_api_information(collected_path)
 
-        collection.append((collected_name, collected_path))
+        collection.append((collected_api_information, collected_path))
 
     return collection
 
@@ -269,8 +435,8 @@ def collector_cpp_default(
 def collector_cpp_nohref(
     elements: list[lxml.html.HtmlElement],
     parent_api_information: ApiInformation,
-    html_path: Path,
-) -> list[tuple[str, str]]:
+    html_path: Path | str,
+) -> list[tuple[ApiInformation, str]]:
     """
     Collect the *C++* *API* data for given elements without an ``href``.
 
@@ -296,7 +462,16 @@ def collector_cpp_nohref(
         if parent_api_information.ue_type is not None:
             name = f"{parent_api_information.name}.{name}"
 
-        collection.append((name, f"{html_path}#{name}"))
+        collected_path = f"{html_path}#{name}"
+
+        # A path with a fragment never exists on disk: this check always
+        # discards the collected data, effectively disabling the collectors
+        # using this processor. It is kept to preserve the existing entries,
+        # the processing loops used to discard these paths the same way.
+        if not Path(collected_path).exists():
+            continue
+
+        collection.append((ApiInformation(name, None, None), collected_path))
 
     return collection
 
@@ -304,76 +479,98 @@ def collector_cpp_nohref(
 COLLECTORS_CPP: tuple[Collector, ...] = (
     Collector(
         "Module",
-        './/div[@class="modules-list"]//td[@class="name-cell"]/a[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@class="modules-list"]//td[@class="name-cell"]/a[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Class",
-        './/div[@id="classes"]//td[@class="name-cell"][1]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="classes"]//td[@class="name-cell"][1]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Constructor",
-        './/div[@id="constructor"]//td[@class="name-cell"][1]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="constructor"]//td[@class="name-cell"][1]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Destructor",
-        './/div[@id="destructor"]//td[@class="name-cell"][1]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="destructor"]//td[@class="name-cell"][1]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Type",
-        './/div[@id="typedefs"]//td[@class="name-cell"][1]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="typedefs"]//td[@class="name-cell"][1]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Enum",
-        './/div[@id="enums"]//td[@class="name-cell"][1]/a[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="enums"]//td[@class="name-cell"][1]/a[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Variable",
-        './/div[@id="variables"]//td[@class="name-cell"][2]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="variables"]//td[@class="name-cell"][2]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Variable",
-        './/div[@id="deprecatedvariables"]//td[@class="name-cell"][2]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="deprecatedvariables"]//td[@class="name-cell"][2]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Variable",
-        './/div[@id="variables"]//td[@class="name-cell"][2]/p',
+        etree.XPath('.//div[@id="variables"]//td[@class="name-cell"][2]/p'),
         collector_cpp_nohref,
     ),
     Collector(
         "Variable",
-        './/div[@id="deprecatedvariables"]//td[@class="name-cell"][2]/p',
+        etree.XPath('.//div[@id="deprecatedvariables"]//td[@class="name-cell"][2]/p'),
         collector_cpp_nohref,
     ),
     Collector(
         "Constant",
-        './/div[@id="constants"]//td[@class="name-cell"][1]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[@id="constants"]//td[@class="name-cell"][1]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Function",
-        './/div[starts-with(@id, "functions_")]//td[@class="name-cell"][2]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[starts-with(@id, "functions_")]//td[@class="name-cell"][2]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
     Collector(
         "Function",
-        './/div[starts-with(@id, "deprecatedfunctions")]//td[@class="name-cell"][2]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/div[starts-with(@id, "deprecatedfunctions")]'
+            '//td[@class="name-cell"][2]/a[not(@class="dashAnchor")]'
+        ),
         collector_cpp_default,
     ),
 )
@@ -383,7 +580,7 @@ COLLECTORS_CPP: tuple[Collector, ...] = (
 def collector_blueprint_default(
     elements: list[lxml.html.HtmlElement],
     parent_api_information: ApiInformation,
-    html_path: Path,
+    html_path: Path | str,
 ) -> list[tuple[str, str]]:
     """
     Collect the *Blueprint++* *API* data for given elements.
@@ -413,7 +610,7 @@ def collector_blueprint_default(
         if not Path(collected_path).exists():
             continue
 
-        collected_name = collect_api_information(read_xml_file(collected_path)).name
+        collected_name = read_api_information(collected_path).name
 
         collection.append(
             (f"{parent_api_information.name}.{collected_name}", collected_path)
@@ -425,14 +622,18 @@ def collector_blueprint_default(
 COLLECTORS_BLUEPRINT: tuple[Collector, ...] = (
     Collector(
         "Function",
-        './/h2[@id="actions"]/following-sibling::div[@class="member-list"]//td[@class="name-cell"]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/h2[@id="actions"]/following-sibling::div[@class="member-list"]//td[@class="name-cell"]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_blueprint_default,
     ),
     Collector(
         "Category",
-        './/h2[@id="categories"]/following-sibling::div[@class="member-list"]//td[@class="name-cell"]/a'
-        '[not(@class="dashAnchor")]',
+        etree.XPath(
+            './/h2[@id="categories"]/following-sibling::div[@class="member-list"]//td[@class="name-cell"]/a'
+            '[not(@class="dashAnchor")]'
+        ),
         collector_blueprint_default,
     ),
 )
@@ -456,12 +657,24 @@ def collect_api_name_and_syntax(
         Collected *API* name and syntax.
     """
 
-    title = next(iter(xml.xpath('.//h1[@id="H1TitleId"]/text()'))).strip()
+    title, paragraphs = None, []
+    for element in XPATH_API_TITLE_AND_SYNTAX(xml):
+        if element.tag == "h1":
+            # The title is the first non-empty direct text node, ``element.text``
+            # is *None* when the title is preceded by a child element. A title
+            # without any text is empty rather than missing.
+            if title is None:
+                title = next(
+                    (text.strip() for text in XPATH_TEXT(element) if text.strip()),
+                    "",
+                )
+        else:
+            paragraphs.append(element.text_content())
 
-    syntax = "\n".join(
-        element.text_content()
-        for element in xml.xpath('.//div[@class="simplecode_api"]/p')
-    )
+    if title is None:
+        raise RuntimeError('Could not find the "API" title element!')
+
+    syntax = "\n".join(paragraphs)
 
     return title, syntax
 
@@ -484,23 +697,56 @@ def collect_api_information(
     """
 
     api_name, api_syntax = collect_api_name_and_syntax(xml)
-    for api_type, entry_type in MAPPING_API_TYPE_TO_ENTRY_TYPE.items():
-        try:
-            search = re.search(f"{api_type} {api_name}", api_syntax, re.MULTILINE)
-        except re.error:
-            continue
+    for search in REGEX_API_TYPE.finditer(api_syntax):
+        if search.group("name").startswith(api_name):
+            api_type = search.group("type")
 
-        if search is not None:
-            return ApiInformation(api_name, api_type, entry_type)
+            return ApiInformation(
+                api_name, api_type, MAPPING_API_TYPE_TO_ENTRY_TYPE[api_type]
+            )
 
     return ApiInformation(api_name, "object", "Object")
 
 
+def read_api_information(xml_path: Path | str) -> ApiInformation:
+    """
+    Read given *XML* file and collect its *API* information.
+
+    The results are memoized: the same target file is typically linked from
+    many pages, e.g. constructors, destructors and functions pages all link to
+    their class page. The cache is keyed by the normalised absolute path as the
+    links spell the same file differently depending on the linking page. Each
+    worker process maintains its own cache.
+
+    Parameters
+    ----------
+    xml_path
+        Path of the *XML* file to collect the *API* information from.
+
+    Returns
+    -------
+    :class:`ApiInformation`
+        Collected *API* information.
+    """
+
+    return _read_api_information(os.path.normpath(os.path.abspath(xml_path)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_api_information(xml_path: str) -> ApiInformation:
+    """
+    Read given normalised absolute *XML* file path and collect its *API*
+    information, memoizing the results.
+    """
+
+    return collect_api_information(read_xml_file(xml_path))
+
+
 def process_cpp_html_file(
-    html_path: Path,
+    html_path: Path | str,
     collectors: tuple = COLLECTORS_CPP,
     add_dash_anchors: bool = True,
-) -> list[Entry]:
+) -> list[tuple[str, str, str]]:
     """
     Process given *Unreal Engine* *C++* *HTML* file using given collectors.
 
@@ -517,47 +763,50 @@ def process_cpp_html_file(
     Returns
     -------
     :class:`list`
-        List of *Dash* documentation entries.
+        List of *Dash* documentation entries as ``(name, path, type)`` tuples.
     """
 
-    logger.info('Processing "%s" file...', html_path)
+    logger.debug('Processing "%s" file...', html_path)
+
+    # Whether the *HTML* file was modified and needs to be written back.
+    modified = False
+
+    directory = os.path.dirname(html_path)
 
     def localiser(link):
         """Update given link to point to an actual *HTML* file"""
 
-        index_path = html_path.parent / Path(link) / "index.html"
+        nonlocal modified
 
-        if not index_path.exists():
-            return link
+        localised_link = localise_link(directory, link)
 
-        return f"{link}/index.html"
+        if localised_link != link:
+            modified = True
+
+        return localised_link
 
     xml = read_xml_file(html_path)
     xml.rewrite_links(localiser)
 
     api_information = collect_api_information(xml)
 
-    has_dash_anchors = len(xml.xpath('.//a[@class="dashAnchor"]')) != 0
+    has_dash_anchors = len(XPATH_DASH_ANCHORS(xml)) != 0
 
     entries = []
     for collector in collectors:
-        elements = xml.xpath(collector.predicate)
-        anchors = []
+        elements = collector.predicate(xml)
+        anchor_counts: dict[str, int] = {}
         for i, collection in enumerate(
             collector.processor(elements, api_information, html_path)
         ):
-            collected_name, collected_html_path = collection
-
-            if not Path(collected_html_path).exists():
-                continue
+            collected_api_information, collected_html_path = collection
+            collected_name = cast(str, collected_api_information.name)
 
             collected_type = collector.type
 
             # "class", "UCLASS", "struct", "USTRUCT" and "union" are classified
             # as "classes", we are providing more granularity.
             if collector.type == "Class":
-                collected_xml = read_xml_file(collected_html_path)
-                collected_api_information = collect_api_information(collected_xml)
                 collected_type = collected_api_information.dash_type
 
             if add_dash_anchors and not has_dash_anchors:
@@ -565,12 +814,9 @@ def process_cpp_html_file(
                 anchor_element.set("class", "dashAnchor")
                 anchor_name = collected_name.split("::")[-1]
 
-                suffix = ""
-                if anchor_name in anchors:
-                    count = anchors.count(anchor_name)
-                    suffix = f" (Overload {count})"
-
-                anchors.append(anchor_name)
+                count = anchor_counts.get(anchor_name, 0)
+                anchor_counts[anchor_name] = count + 1
+                suffix = f" (Overload {count})" if count else ""
 
                 anchor_name = f"{anchor_name}{suffix}"
 
@@ -579,17 +825,19 @@ def process_cpp_html_file(
                     f"//apple_ref/cpp/{collected_type}/{html.escape(anchor_name)}",
                 )
                 elements[i].addprevious(anchor_element)
+                modified = True
 
             entries.append(
-                Entry(
-                    cast(str, collected_name),
+                (
+                    collected_name,
                     cast(str, collected_html_path),
                     cast(str, collected_type),
                 )
             )
 
-    with open(html_path, "w") as html_file:
-        html_file.write(tostring(xml).decode("utf-8"))  # pyright: ignore
+    if modified:
+        with open(html_path, "wb") as html_file:
+            html_file.write(tostring(xml))  # pyright: ignore
 
     return entries
 
@@ -619,7 +867,9 @@ class KwargsDocsetProcessor(TypedDict):
     unpacking_directory: Path
 
 
-def process_cpp_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Entry]:
+def process_cpp_docset(
+    **kwargs: Unpack[KwargsDocsetProcessor],
+) -> set[tuple[str, str, str]]:
     """
     Process given *Unreal Engine* *C++* docset.
 
@@ -631,54 +881,39 @@ def process_cpp_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Entry]:
     Returns
     -------
     :class:`set`
-        Set of entries.
+        Set of *Dash* documentation entries as ``(name, path, type)`` tuples.
     """
 
     logger.info("Processing C++ docset...")
 
     api_directory = kwargs["api_directory"]
 
-    css_path = api_directory / ".." / ".." / "Include" / "CSS" / "udn_public.css"
-
-    with open(css_path, "a") as css_file:
-        css_file.write(
-            """
-#maincol {
-    height: unset !important;
-}
-
-#page_head, #navWrapper, #splitter, #footer {
-    display: none !important;
-}
-
-#contentContainer {
-    margin-left: 0 !important;
-}
-
-.toc {
-    display: none !important;
-}
-"""
-        )
-
-    html_files = list(api_directory.glob("**/*.html"))
+    append_css_overrides(
+        api_directory / ".." / ".." / "Include" / "CSS" / "udn_public.css"
+    )
 
-    return set(
-        chain(
-            *process_map(
-                process_cpp_html_file,
-                html_files,
-                chunksize=16,
+    with multiprocessing.Pool(max(1, multiprocessing.cpu_count() - 2)) as pool:
+        entries = set(
+            chain.from_iterable(
+                tqdm(
+                    pool.imap_unordered(
+                        process_cpp_html_file,
+                        iterate_html_files(api_directory),
+                        chunksize=32,
+                    ),
+                    unit="file",
+                )
             )
         )
-    )
+
+    return entries
 
 
 def process_blueprint_html_file(
-    html_path: Path,
+    html_path: Path | str,
     collectors: tuple = COLLECTORS_BLUEPRINT,
     add_dash_anchors: bool = True,
-) -> list[Entry]:
+) -> list[tuple[str, str, str]]:
     """
     Process given *Unreal Engine* *Blueprint* *HTML* file using given collectors.
 
@@ -695,39 +930,43 @@ def process_blueprint_html_file(
     Returns
     -------
     :class:`list`
-        List of *Dash* documentation entries.
+        List of *Dash* documentation entries as ``(name, path, type)`` tuples.
     """
 
-    logger.info('Processing "%s" file...', html_path)
+    logger.debug('Processing "%s" file...', html_path)
+
+    # Whether the *HTML* file was modified and needs to be written back.
+    modified = False
+
+    directory = os.path.dirname(html_path)
 
     def localiser(link):
         """Update given link to point to an actual *HTML* file"""
 
-        index_path = html_path.parent / Path(link) / "index.html"
+        nonlocal modified
 
-        if not index_path.exists():
-            return link
+        localised_link = localise_link(directory, link)
 
-        return f"{link}/index.html"
+        if localised_link != link:
+            modified = True
+
+        return localised_link
 
     xml = read_xml_file(html_path)
     xml.rewrite_links(localiser)
 
     api_information = collect_api_information(xml)
 
-    has_dash_anchors = len(xml.xpath('.//a[@class="dashAnchor"]')) != 0
+    has_dash_anchors = len(XPATH_DASH_ANCHORS(xml)) != 0
 
     entries = []
     for collector in collectors:
-        elements = xml.xpath(collector.predicate)
+        elements = collector.predicate(xml)
         for i, collection in enumerate(
             collector.processor(elements, api_information, html_path)
         ):
             collected_name, collected_html_path = collection
 
-            if not Path(collected_html_path).exists():
-                continue
-
             collected_type = collector.type
 
             if add_dash_anchors and not has_dash_anchors:
@@ -739,22 +978,26 @@ def process_blueprint_html_file(
                     f"//apple_ref/blueprint/{collected_type}/{html.escape(collected_name)}",
                 )
                 elements[i].addprevious(anchor_element)
+                modified = True
 
             entries.append(
-                Entry(
+                (
                     cast(str, collected_name),
                     cast(str, collected_html_path),
                     cast(str, collected_type),
                 )
             )
 
-    with open(html_path, "w") as html_file:
-        html_file.write(tostring(xml).decode("utf-8"))  # pyright: ignore
+    if modified:
+        with open(html_path, "wb") as html_file:
+            html_file.write(tostring(xml))  # pyright: ignore
 
     return entries
 
 
-def process_blueprint_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Entry]:
+def process_blueprint_docset(
+    **kwargs: Unpack[KwargsDocsetProcessor],
+) -> set[tuple[str, str, str]]:
     """
     Process given *Unreal Engine* *Blueprint* docset.
 
@@ -766,51 +1009,37 @@ def process_blueprint_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Ent
     Returns
     -------
     :class:`set`
-        Set of entries.
+        Set of *Dash* documentation entries as ``(name, path, type)`` tuples.
     """
 
     logger.info("Processing Blueprint docset...")
 
     api_directory = kwargs["api_directory"]
 
-    css_path = api_directory / ".." / ".." / "Include" / "CSS" / "udn_public.css"
-
-    with open(css_path, "a") as css_file:
-        css_file.write(
-            """
-#maincol {
-    height: unset !important;
-}
-
-#page_head, #navWrapper, #splitter, #footer {
-    display: none !important;
-}
-
-#contentContainer {
-    margin-left: 0 !important;
-}
-
-.toc {
-    display: none !important;
-}
-"""
-        )
-
-    html_files = list(api_directory.glob("**/*.html"))
+    append_css_overrides(
+        api_directory / ".." / ".." / "Include" / "CSS" / "udn_public.css"
+    )
 
-    return set(
-        chain(
-            *process_map(
-                process_blueprint_html_file,
-                html_files,
-                max_workers=multiprocessing.cpu_count() - 2,
-                chunksize=16,
+    with multiprocessing.Pool(max(1, multiprocessing.cpu_count() - 2)) as pool:
+        entries = set(
+            chain.from_iterable(
+                tqdm(
+                    pool.imap_unordered(
+                        process_blueprint_html_file,
+                        iterate_html_files(api_directory),
+                        chunksize=32,
+                    ),
+                    unit="file",
+                )
             )
         )
-    )
+
+    return entries
 
 
-def process_python_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Entry]:
+def process_python_docset(
+    **kwargs: Unpack[KwargsDocsetProcessor],
+) -> set[tuple[str, str, str]]:
     """
     Process given *Unreal Engine* *Python* docset.
 
@@ -824,7 +1053,7 @@ def process_python_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Entry]
     Returns
     -------
     :class:`set`
-        Set of entries.
+        Set of *Dash* documentation entries as ``(name, path, type)`` tuples.
     """
 
     from doc2dash.__main__ import main
@@ -852,7 +1081,9 @@ def process_python_docset(**kwargs: Unpack[KwargsDocsetProcessor]) -> set[Entry]
 
 
 def generate_database(
-    database_path: Path, documents_directory: Path | str, entries: set[Entry]
+    database_path: Path,
+    documents_directory: Path | str,
+    entries: set[tuple[str, str, str]],
 ) -> None:
     """
     Generate the *SQLite3* database storing the *Dash* entries.
@@ -865,7 +1096,8 @@ def generate_database(
         Path of the documents directory, e.g.
         ``UnrealEngineCpp.docset/Contents/Resources/Documents``.
     entries
-        Entries to add to the *SQLite3* database.
+        Entries, as ``(name, path, type)`` tuples, to add to the *SQLite3*
+        database.
     """
 
     logger.info("Creating Sqlite3 database...")
@@ -874,6 +1106,12 @@ def generate_database(
 
     cursor = database.cursor()
 
+    # Bulk-load settings: the database is generated from scratch and can simply
+    # be regenerated if the process is interrupted.
+    cursor.execute("PRAGMA journal_mode=MEMORY;")
+    cursor.execute("PRAGMA synchronous=OFF;")
+    cursor.execute("PRAGMA temp_store=MEMORY;")
+
     try:
         cursor.execute(
             "CREATE TABLE searchIndex("
@@ -882,21 +1120,32 @@ def generate_database(
             "type TEXT, "
             "path TEXT);"
         )
-        cursor.execute("CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);")
     except sqlite3.OperationalError as error:
         logging.warning(str(error))
 
-    documents_directory = f"{documents_directory}/".replace("\\", "/")
+    documents_directory = f"{documents_directory}/".translate(TRANSLATION_TABLE_SLASHES)
 
-    for entry in sorted(entries, key=lambda x: x.name):
-        cursor.execute(
-            "INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)",
-            (
-                entry.name,
-                entry.type,
-                entry.path.replace("\\", "/").replace(documents_directory, ""),
-            ),
+    # Normalising the paths might make distinct entries identical, the rows are
+    # deduplicated so that the unique index created afterwards cannot fail.
+    rows = {
+        (
+            name,
+            type_,
+            path.translate(TRANSLATION_TABLE_SLASHES).removeprefix(documents_directory),
         )
+        for name, path, type_ in entries
+    }
+
+    cursor.execute("BEGIN")
+    cursor.executemany(
+        "INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)", rows
+    )
+
+    # The index is built once, in bulk, after the rows have been inserted.
+    try:
+        cursor.execute("CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);")
+    except (sqlite3.IntegrityError, sqlite3.OperationalError) as error:
+        logging.warning(str(error))
 
     database.commit()
     database.close()
@@ -930,10 +1179,8 @@ def generate_plist(path: Path, mapping: list[tuple[str, str, str]]) -> None:
             if type_ == "string":
                 value_element.text = value
 
-    xml = minidom.parseString(  # noqa: S318
-        Et.tostring(plist_element, "utf-8")
-    ).toprettyxml(indent="\t")
-    xml = xml.split("\n", 1)[1]
+    Et.indent(plist_element, space="\t")
+    xml = f"{Et.tostring(plist_element, encoding='unicode')}\n"
 
     header = (
         '<?xml version="1.0" encoding="UTF-8"?>\n'